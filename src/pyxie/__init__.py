@@ -14,41 +14,48 @@
 
 """Pyxie - A simple static site generator with component-based layouts."""
 
-from .pyxie import Pyxie
-from .layouts import layout
-from .types import (    
-    ContentItem,    
-    Metadata,
-    PathLike,
-)
+import importlib
+from typing import TYPE_CHECKING
+
 from .errors import (
     PyxieError,
     LayoutError,
     ContentError,
     RenderError,
 )
-from .renderer import render_content
-from .collection import Collection
+
+if TYPE_CHECKING:
+    from .pyxie import Pyxie
+    from .layouts import layout
+    from .types import ContentItem, Metadata, PathLike
+    from .renderer import render_content
+    from .collection import Collection
 
 __version__ = "0.1.3"
 
-# Add html property and render method to ContentItem
-# This avoids circular imports while keeping the API clean
-def _get_html(self):
-    from .renderer import render_content
-    try:
-        return render_content(self)
-    except Exception as e:
-        return f"Error: {e}"
+# Public names resolved on first access (PEP 562) so importing the package
+# does not pull in the renderer, FastHTML and mistletoe up front
+_LAZY_IMPORTS = {
+    "Pyxie": ".pyxie",
+    "layout": ".layouts",
+    "ContentItem": ".types",
+    "Metadata": ".types",
+    "PathLike": ".types",
+    "render_content": ".renderer",
+    "Collection": ".collection",
+}
 
-def _render_for_fasthtml(self):
-    from fasthtml.common import NotStr
-    return NotStr(self.html) if hasattr(self, 'html') else None
+def __getattr__(name: str):
+    if (module_name := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
 
-ContentItem.html = property(_get_html)
-ContentItem.render = _render_for_fasthtml
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
 
-__all__ = [
+__all__ = (
     # Main class
     "Pyxie",
     
@@ -71,4 +78,4 @@ __all__ = [
     
     # Collection
     "Collection",
-] 
\ No newline at end of file
+) 
\ No newline at end of file
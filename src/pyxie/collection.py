@@ -95,7 +95,8 @@ class Collection:
         metadata = {**self.default_metadata, "layout": self.default_layout}
         
         if item := load_content_file(file, metadata, logger):
-            log(logger, "Collection", "debug", "load", f"Successfully loaded {file} with metadata: {item.metadata}")
+            if logger.isEnabledFor(logging.DEBUG):
+                log(logger, "Collection", "debug", "load", f"Successfully loaded {file} with metadata: {item.metadata}")
             item.collection = self.name
             self._items[item.slug] = item
         else:
@@ -38,7 +38,7 @@ DEFAULT_METADATA = {
 }
 
 # HTML tags that should not be treated as custom blocks
-STANDARD_HTML_TAGS = {
+STANDARD_HTML_TAGS = frozenset({
     # Basic text elements
     'div', 'span', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'pre', 'code',
     
@@ -65,4 +65,4 @@ STANDARD_HTML_TAGS = {
     # Other
     'figure', 'figcaption', 'time', 'mark', 'ruby', 'rt', 'rp',
     'bdi', 'bdo', 'wbr', 'slot', 'template', 'portal'
-}
+})
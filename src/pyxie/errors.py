@@ -15,18 +15,33 @@
 """Core exceptions for Pyxie."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, TypeVar, Union, Callable, Any
 
 T = TypeVar('T')
 
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+_ERROR_HTML_TEMPLATE = '<div class="fasthtml-error">ERROR: %s</div>'
+
 def log(logger_instance: logging.Logger, module: str, level: str, operation: str, message: str, file_path: Optional[Path] = None) -> None:
-    """Log message with standardized format."""
-    if file_path:
-        file_info = f" in file {file_path}"
-    else:
-        file_info = ""
-    getattr(logger_instance, level)(f"[{module}] {operation}: {message}{file_info}")
+    """Log message with standardized format.
+    
+    Formatting is deferred to the logging framework and skipped entirely
+    when the level is disabled for the logger.
+    """
+    level_no = _LOG_LEVELS[level]
+    if not logger_instance.isEnabledFor(level_no):
+        return
+    file_info = f" in file {file_path}" if file_path else ""
+    logger_instance.log(level_no, "[%s] %s: %s%s", module, operation, message, file_info)
 
 def log_errors(logger: logging.Logger, component: str, action: str) -> Callable:
     """Decorator to log errors and re-raise.
@@ -60,6 +75,11 @@ def log_errors(logger: logging.Logger, component: str, action: str) -> Callable:
         return wrapper
     return decorator
 
+@lru_cache(maxsize=64)
+def _error_prefix(error_type: type) -> str:
+    """Message prefix for an exception class, computed once per class."""
+    return f"{error_type.__name__}: "
+
 def format_error_html(error: Union[Exception, str], context: Optional[str] = None) -> str:
     """Format an error message as HTML for display.
     
@@ -67,17 +87,17 @@ def format_error_html(error: Union[Exception, str], context: Optional[str] = Non
         error: Either an Exception object or an error message string
         context: Optional context for the error (e.g., 'parsing', 'rendering')
     """
-    if isinstance(error, Exception):
-        error_message = f"{error.__class__.__name__}: {error}"
-        if isinstance(error, SyntaxError):
-            error_message = f"Syntax error: {error}"
+    if isinstance(error, SyntaxError):
+        error_message = "Syntax error: " + str(error)
+    elif isinstance(error, Exception):
+        error_message = _error_prefix(type(error)) + str(error)
     else:
         error_message = str(error)
     
     if context:
         error_message = f"{context.upper()}: {error_message}"
     
-    return f'<div class="fasthtml-error">ERROR: {error_message}</div>'
+    return _ERROR_HTML_TEMPLATE % error_message
 
 class PyxieError(Exception):
     """Base exception for all Pyxie errors."""
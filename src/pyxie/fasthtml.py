@@ -14,10 +14,13 @@
 
 """FastHTML processing for Pyxie - execution of Python code and rendering of components."""
 
-import logging, re
-from typing import Optional, Any, List, Dict
+import ast, logging
+from functools import lru_cache, partial
+from types import CodeType, MappingProxyType
+from typing import Optional, Any, Callable, ClassVar, List, Dict, Tuple
 from pathlib import Path
 from textwrap import dedent
+from weakref import WeakKeyDictionary
 from fastcore.xml import FT
 import fasthtml.common as ft_common
 from .utilities import safe_import
@@ -26,36 +29,100 @@ from .errors import log, log_errors
 from .parser import VOID_ELEMENTS
 
 logger = logging.getLogger(__name__)
-IMPORT_PATTERN = re.compile(r'^(?:from\s+([^\s]+)\s+import|import\s+([^#\n]+))', re.MULTILINE)
+_EMPTY_RESULT = RenderResult()
+_JS_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
 
 def py_to_js(obj, indent=0, indent_str="  "):
+    """Convert a Python value to a JavaScript literal, falling back to str() on failure."""
     try:
-        current_indent, next_indent = indent_str * indent, indent_str * (indent + 1)
-        match obj:
-            case None: return "null"
-            case bool(): return str(obj).lower()
-            case int() | float(): return str(obj)
-            case str() if obj.startswith("__FUNCTION__"):
-                return obj[12:] if obj[12:].startswith("function") else f"function(index) {{ return {obj[12:]}; }}"
-            case str():
-                escaped = obj.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-                return f'"{escaped}"'
-            case dict():
-                if not obj: return "{}"
-                pairs = [f"{next_indent}{py_to_js(k)}: {py_to_js(v, indent + 1)}" for k, v in obj.items()]
-                return "{\n" + ",\n".join(pairs) + f"\n{current_indent}}}"
-            case list():
-                if not obj: return "[]"
-                items = [f"{next_indent}{py_to_js(item, indent + 1)}" for item in obj]
-                return "[\n" + ",\n".join(items) + f"\n{current_indent}]"
-            case _ if callable(obj):
-                func_name = getattr(obj, '__name__', '<lambda>')
-                return f"function {func_name if func_name != '<lambda>' else ''}(index) {{ return index * 100; }}"
-            case _: return str(obj)
+        return _py_to_js(obj, indent, indent_str)
     except Exception as e:
         log(logger, "FastHTML", "error", "conversion", f"{e}")
         return str(obj)
 
+def _py_to_js(obj, indent, indent_str):
+    out = []
+    _encode(obj, out, indent, indent_str)
+    return "".join(out)
+
+def _encode(obj, out, indent, indent_str):
+    # Appends fragments to out; exact builtin types dispatch through _ENCODERS in one lookup
+    _ENCODERS.get(type(obj), _encode_other)(obj, out, indent, indent_str)
+
+def _encode_none(obj, out, indent, indent_str): out.append("null")
+
+def _encode_bool(obj, out, indent, indent_str): out.append("true" if obj else "false")
+
+def _encode_number(obj, out, indent, indent_str): out.append(str(obj))
+
+def _encode_str(obj, out, indent, indent_str):
+    if obj.startswith("__FUNCTION__"):
+        out.append(obj[12:] if obj[12:].startswith("function") else f"function(index) {{ return {obj[12:]}; }}")
+    else:
+        out.append(f'"{obj.translate(_JS_ESCAPE_TABLE)}"')
+
+def _encode_dict(obj, out, indent, indent_str):
+    if not obj:
+        out.append("{}")
+        return
+    start = len(out)
+    separator = "{\n" + indent_str * (indent + 1)
+    item_separator = ",\n" + indent_str * (indent + 1)
+    try:
+        for k, v in obj.items():
+            out.append(separator)
+            _encode(k, out, 0, indent_str)
+            out.append(": ")
+            _encode(v, out, indent + 1, indent_str)
+            separator = item_separator
+    except Exception as e:
+        return _encode_fallback(obj, out, start, e)
+    out.append(f"\n{indent_str * indent}}}")
+
+def _encode_list(obj, out, indent, indent_str):
+    if not obj:
+        out.append("[]")
+        return
+    start = len(out)
+    separator = "[\n" + indent_str * (indent + 1)
+    item_separator = ",\n" + indent_str * (indent + 1)
+    try:
+        for item in obj:
+            out.append(separator)
+            _encode(item, out, indent + 1, indent_str)
+            separator = item_separator
+    except Exception as e:
+        return _encode_fallback(obj, out, start, e)
+    out.append(f"\n{indent_str * indent}]")
+
+def _encode_fallback(obj, out, start, e):
+    # A failing element degrades only its enclosing container to str(); if that fails too it propagates up
+    del out[start:]
+    log(logger, "FastHTML", "error", "conversion", f"{e}")
+    out.append(str(obj))
+
+def _encode_other(obj, out, indent, indent_str):
+    # Subclasses of the builtins keep the isinstance semantics; everything else is a callable or str()
+    match obj:
+        case int() | float(): _encode_number(obj, out, indent, indent_str)
+        case str(): _encode_str(obj, out, indent, indent_str)
+        case dict(): _encode_dict(obj, out, indent, indent_str)
+        case list(): _encode_list(obj, out, indent, indent_str)
+        case _ if callable(obj):
+            func_name = getattr(obj, '__name__', '<lambda>')
+            out.append(f"function {func_name if func_name != '<lambda>' else ''}(index) {{ return index * 100; }}")
+        case _: out.append(str(obj))
+
+_ENCODERS = {
+    type(None): _encode_none,
+    bool: _encode_bool,
+    int: _encode_number,
+    float: _encode_number,
+    str: _encode_str,
+    dict: _encode_dict,
+    list: _encode_list,
+}
+
 def js_function(func_str): return f"__FUNCTION__{func_str}"
 
 class PyxieXML:
@@ -79,14 +146,10 @@ class PyxieXML:
         content.extend(str(child) for child in self.children)
         return f'<{self.tag}{attr_str}>{" ".join(content)}</{self.tag}>'
 
-def create_namespace(context_path: Optional[Path] = None) -> Dict[str, Any]:
-    """Create a namespace for FastHTML execution."""
+def _build_base_namespace() -> Dict[str, Any]:
+    """Collect the names every execution namespace starts from."""
     namespace = {name: getattr(ft_common, name) for name in dir(ft_common) if not name.startswith('_')}
-    def show(*args):
-        if '__results__' not in namespace: namespace['__results__'] = []
-        namespace['__results__'].extend(args)
     namespace.update({
-        'show': show,
         'PyxieXML': PyxieXML,
         'FT': FT,
         '__builtins__': __builtins__,
@@ -94,12 +157,43 @@ def create_namespace(context_path: Optional[Path] = None) -> Dict[str, Any]:
     })
     return namespace
 
+# Read-only template: executed code only ever sees copies
+_BASE_NAMESPACE = MappingProxyType(_build_base_namespace())
+
+def _show(namespace: Dict[str, Any], *args: Any) -> None:
+    """Collect components passed to show() in the executing namespace."""
+    namespace.setdefault('__results__', []).extend(args)
+
+def create_namespace(context_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Create a namespace for FastHTML execution."""
+    namespace = _BASE_NAMESPACE.copy()
+    namespace['show'] = partial(_show, namespace)
+    return namespace
+
+@lru_cache(maxsize=256)
+def _normalize_code(content: str) -> str:
+    """Strip and dedent a raw block; the same block text recurs on every re-render."""
+    return dedent(content.strip())
+
+@lru_cache(maxsize=256)
+def _compile_code(code: str) -> Tuple[CodeType, Tuple[str, ...]]:
+    """Parse a block once into its code object and top-level imported module names."""
+    tree = ast.parse(code, '<string>', 'exec')
+    imports = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imports.append(node.module)
+    return compile(tree, '<string>', 'exec'), tuple(imports)
+
 def process_imports(code: str, namespace: dict, context_path=None) -> None:
-    for match in IMPORT_PATTERN.finditer(code):
-        if module := match.group(1) or match.group(2):
-            for name in module.split(','):
-                if clean_name := name.split('#')[0].strip():
-                    safe_import(clean_name, namespace, context_path, logger)
+    try:
+        imports = _compile_code(code)[1]
+    except SyntaxError:
+        return  # Code that cannot parse imports nothing; executing it reports the error
+    for module_name in imports:
+        safe_import(module_name, namespace, context_path, logger)
 
 class FastHTMLExecutor:
     def __init__(self, context_path: Optional[Path] = None):
@@ -113,7 +207,6 @@ class FastHTMLExecutor:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.namespace = None
     
-    @log_errors(logger, "FastHTML", "execute")
     def execute(self, code: str) -> List[Any]:
         if self.namespace is None:
             self.namespace = create_namespace(self.context_path)
@@ -121,21 +214,43 @@ class FastHTMLExecutor:
         process_imports(code, self.namespace, self.context_path)
         self.namespace['__results__'] = []
         self.namespace['__builtins__'] = globals()['__builtins__']
-        exec(code, self.namespace)
+        exec(_compile_code(code)[0], self.namespace)
         return self.namespace.get('__results__', [])
 
 class FastHTMLRenderer:
+    # Weak keys: classes defined inside executed blocks must not be pinned here
+    _renderers: ClassVar[WeakKeyDictionary[type, Callable[[Any], str]]] = WeakKeyDictionary()
+    
     @classmethod
     def to_xml(cls, results: List[Any]) -> str:
-        return "\n".join(cls._render_component(r) for r in results).rstrip() if results else ""
+        if not results: return ""
+        render = cls._render_component
+        if len(results) == 1: return render(results[0]).rstrip()
+        return "\n".join([render(r) for r in results]).rstrip()
     
     @classmethod
     def _render_component(cls, component: Any) -> str:
-        if component is None: return ''
-        if isinstance(component, (str, int, float, bool)): return str(component)
-        if isinstance(component, (list, tuple)): return ' '.join(cls._render_component(c) for c in component)
-        if not isinstance(component, FT): return str(component)
-        
+        component_type = type(component)
+        render = cls._renderers.get(component_type)
+        if render is None:
+            render = cls._renderers[component_type] = cls._pick_renderer(component_type)
+        return render(component)
+    
+    @classmethod
+    def _pick_renderer(cls, component_type: type) -> Callable[[Any], str]:
+        """Choose how to render a component type; decided once per type."""
+        if component_type is type(None): return lambda component: ''
+        if issubclass(component_type, (str, int, float, bool)): return str
+        if issubclass(component_type, (list, tuple)): return cls._render_sequence
+        if issubclass(component_type, FT): return cls._render_ft
+        return str
+    
+    @classmethod
+    def _render_sequence(cls, components: Any) -> str:
+        return ' '.join([cls._render_component(c) for c in components])
+    
+    @classmethod
+    def _render_ft(cls, component: FT) -> str:
         tag = component.__class__.__name__.lower()
         attrs, content = {}, []
         
@@ -151,14 +266,15 @@ class FastHTMLRenderer:
         attr_list = [f'{k}="{v}"' if v is not True else k for k, v in attrs.items() if v is not False and v is not None and not k.startswith('_')]
         attr_str = ' ' + ' '.join(attr_list) if attr_list else ''
         
-        if tag.lower() == 'script':
+        tag_lower = tag.lower()
+        if tag_lower == 'script':
             script_content = [str(c) if isinstance(c, str) else cls._render_component(c) for c in content]
             return f'<script{attr_str}>\n{" ".join(script_content)}\n</script>'
                 
-        if tag.lower() in VOID_ELEMENTS:
+        if tag_lower in VOID_ELEMENTS:
             return f'<{tag}{attr_str}/>'
         
-        rendered_content = ' '.join(cls._render_component(c) for c in content)
+        rendered_content = ' '.join([cls._render_component(c) for c in content])
         return f'<{tag}{attr_str}>{rendered_content}</{tag}>'
 
 @log_errors(logger, "FastHTML", "process")
@@ -172,12 +288,14 @@ def execute_fasthtml(content: str, context_path: Optional[Path] = None) -> Rende
         RenderResult containing the rendered HTML or any error
     """
     if not content: 
-        return RenderResult()
+        return _EMPTY_RESULT
     
-    content = dedent(content.strip())
+    content = _normalize_code(content)
     with FastHTMLExecutor(context_path) as executor:
         try:
             results = executor.execute(content)
-            return RenderResult(content=FastHTMLRenderer.to_xml(results))
+            html = FastHTMLRenderer.to_xml(results)
+            return RenderResult(content=html) if html else _EMPTY_RESULT
         except Exception as e:
+            log(logger, "FastHTML", "error", "execute", str(e))
             return RenderResult(error=str(e))
\ No newline at end of file
@@ -37,12 +37,14 @@ Example:
 """
 
 import logging
-from typing import Any, Callable, Dict, Optional, Protocol, List
+from typing import Any, Callable, Dict, FrozenSet, Optional, Protocol, List, Tuple
 from os import PathLike
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 import importlib
 import inspect
+import os
 from fastcore.xml import FT, to_xml
 from .errors import log, log_errors, LayoutError, LayoutNotFoundError, LayoutValidationError
 from .types import ContentItem
@@ -50,23 +52,36 @@ from .cache import CacheProtocol
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Any file registering a layout references the decorator or registry by name
+LAYOUT_SOURCE_MARKER = b"layout"
+# Conventional layout directories next to the content directory, in search order
+LAYOUT_DIR_NAMES = ("layouts", "templates", "static")
+
+@dataclass(slots=True, frozen=True)
 class LayoutResult:
     """Result of layout resolution."""
     html: str
     error: Optional[str] = None
 
+# Shared result for items with no layout at all; LayoutResult is immutable
+_EMPTY_LAYOUT_RESULT = LayoutResult(html="")
+
+@lru_cache(maxsize=128)
+def _layout_params(func: Callable) -> Tuple[bool, FrozenSet[str]]:
+    """Inspect a layout function once: (takes only 'metadata', accepted parameter names)."""
+    params = inspect.signature(func).parameters
+    return (len(params) == 1 and 'metadata' in params), frozenset(params)
+
 def _apply_layout(layout, metadata):
     """Helper function to apply a layout with appropriate parameters."""
-    sig = inspect.signature(layout.func)
-    params = list(sig.parameters.values())
+    wants_metadata, param_names = _layout_params(layout.func)
     
     # If the layout function expects a single 'metadata' parameter, pass the entire metadata dict
-    if len(params) == 1 and params[0].name == 'metadata':
+    if wants_metadata:
         return layout.create(metadata=metadata)
         
     # Otherwise, filter metadata to match the function's parameters
-    filtered_metadata = {k: v for k, v in metadata.items() if k != "layout" and k in sig.parameters}
+    filtered_metadata = {k: v for k, v in metadata.items() if k != "layout" and k in param_names}
     return layout.create(**filtered_metadata)
 
 def handle_cache_and_layout(item: ContentItem, cache: Optional[CacheProtocol] = None) -> LayoutResult:
@@ -90,19 +105,18 @@ def handle_cache_and_layout(item: ContentItem, cache: Optional[CacheProtocol] =
         return LayoutResult(html=_apply_layout(default_layout, item.metadata))
     
     # If no default layout exists, return empty string
-    return LayoutResult(html="")
+    return _EMPTY_LAYOUT_RESULT
 
 class LayoutFunction(Protocol):
     """Protocol defining a layout function signature."""
     def __call__(self, *args: Any, **kwargs: Any) -> FT: ...
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Layout:
     """Immutable layout registration."""
     name: str
     func: LayoutFunction
     
-    @log_errors(logger, "Layouts", "create")
     def create(self, *args: Any, **kwargs: Any) -> str:
         """Create a layout instance.
         
@@ -135,7 +149,7 @@ class Layout:
             log(logger, "Layouts", "error", "create", f"Error creating layout '{self.name}': {e}")
             raise
 
-@dataclass
+@dataclass(slots=True)
 class LayoutRegistry:
     """Registry of available layouts."""
     _layouts: Dict[str, Layout] = field(default_factory=dict)
@@ -149,16 +163,17 @@ class LayoutRegistry:
     
     def get(self, name: str) -> Layout:
         """Get a layout by name or raise LayoutNotFoundError."""
-        if name not in self._layouts:
-            raise LayoutNotFoundError(f"Layout '{name}' not found")
-        return self._layouts[name]
+        try:
+            return self._layouts[name]
+        except KeyError:
+            raise LayoutNotFoundError(f"Layout '{name}' not found") from None
     
     def create(self, name: str, *args: Any, **kwargs: Any) -> Optional[str]:
         """Create a layout instance by name."""
-        try:
-            return self.get(name).create(*args, **kwargs)
-        except LayoutNotFoundError:
+        layout = self._layouts.get(name)
+        if layout is None:
             return None
+        return layout.create(*args, **kwargs)
     
     def __contains__(self, name: str) -> bool:
         """Check if a layout exists."""
@@ -173,28 +188,37 @@ class LayoutRegistry:
             paths.extend(Path(p) for p in layout_paths)
             
         # If no custom paths exist, or if they don't exist, fall back to default paths
-        if not paths or not any(p.exists() and p.is_dir() for p in paths):
+        if not paths or not any(p.is_dir() for p in paths):
             if content_dir and content_dir.parent:
                 app_dir = content_dir.parent
                 paths.append(app_dir)
                 
-                for dirname in ["layouts", "templates", "static"]:
-                    path = app_dir / dirname
-                    if path.exists() and path.is_dir():
-                        paths.append(path)
+                # Ask the filesystem per name so case-insensitive filesystems still match
+                paths.extend(path for dirname in LAYOUT_DIR_NAMES if (path := app_dir / dirname).is_dir())
                 
         return paths
 
-    def _is_valid_python_file(self, path: Path) -> bool:
-        """Check if a Python file should be processed for layouts."""
-        return (path.suffix == '.py' and 
-                '__pycache__' not in path.parts and
-                not any(part.startswith('.') for part in path.parts))
+    def _find_python_files(self, path: Path) -> List[Path]:
+        """Collect .py files under path, pruning __pycache__ and hidden directories during the walk."""
+        python_files = []
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if d != '__pycache__' and not d.startswith('.')]
+            python_files.extend(Path(root, f) for f in files if f.endswith('.py') and not f.startswith('.'))
+        return python_files
+
+    def _may_define_layouts(self, path: Path) -> bool:
+        """Cheap source check so modules that never mention layouts aren't executed."""
+        try:
+            return LAYOUT_SOURCE_MARKER in path.read_bytes()
+        except OSError:
+            return True  # Let the import attempt surface and log the error
 
     @log_errors(logger, "Layouts", "discover")
     def _process_layout_files(self, python_files: List[Path]) -> None:
         """Process Python files to find and register layouts."""
         for file in python_files:
+            if not self._may_define_layouts(file):
+                continue
             if not (spec := importlib.util.spec_from_file_location(file.stem, file)):
                 continue
                 
@@ -217,12 +241,11 @@ class LayoutRegistry:
         paths = self.resolve_layout_paths(content_dir, layout_paths)
         
         for path in paths:
-            if not path.exists() or not path.is_dir():
+            if not path.is_dir():
                 log(logger, "Layouts", "warning", "discover", f"Layout directory not found: {path}")
                 continue
                 
-            python_files = [f for f in path.glob("**/*.py") if self._is_valid_python_file(f)]
-            self._process_layout_files(python_files)
+            self._process_layout_files(self._find_python_files(path))
 
 # Global registry instance
 registry = LayoutRegistry()
@@ -24,6 +24,8 @@ post-rendering based on convention (non-standard/raw tags).
 import re
 import yaml
 import logging
+from copy import deepcopy
+from functools import lru_cache
 from typing import Dict, Any, Tuple, Optional, ClassVar
 
 # Mistletoe imports
@@ -34,16 +36,24 @@ from mistletoe.block_tokenizer import FileWrapper
 
 from .constants import STANDARD_HTML_TAGS
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError: # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 # --- Constants ---
 
-RAW_BLOCK_TAGS: set[str] = {'script', 'style', 'fasthtml', 'ft'}
+RAW_BLOCK_TAGS: frozenset[str] = frozenset({'script', 'style', 'fasthtml', 'ft'})
 
-VOID_ELEMENTS: set[str] = {
+VOID_ELEMENTS: frozenset[str] = frozenset({
     'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
     'link', 'meta', 'param', 'source', 'track', 'wbr'
-}
+})
+
+# Tags NestedContentToken never claims: raw blocks plus standard HTML
+NON_CUSTOM_TAGS: frozenset[str] = RAW_BLOCK_TAGS | STANDARD_HTML_TAGS
 
 ATTR_PATTERN = re.compile(r"""
     (?P<key>[^\s"'=<>`/]+)
@@ -54,6 +64,15 @@ ATTR_PATTERN = re.compile(r"""
         )
     )?
 """, re.VERBOSE | re.IGNORECASE)
+_iter_attrs = ATTR_PATTERN.finditer
+
+# Possessive quantifiers keep unterminated tags from backtracking cubically;
+# giving back whitespace can never let '/?>' match, so matches are unchanged.
+OPEN_TAG_PATTERN = re.compile(
+    r'^\s*<([a-zA-Z][a-zA-Z0-9\-_]*+)' # 1: Tag name
+    r'(?:\s++([^>]*?))?'               # 2: Attributes (non-greedy)
+    r'\s*+(/?)>'                       # 3: Optional self-closing slash and closing >
+)
 
 FRONTMATTER_PATTERN = re.compile(
     r'\A\s*---\s*\n(?P<frontmatter>.*?)\n\s*---\s*\n(?P<content>.*)', re.DOTALL
@@ -63,21 +82,38 @@ FRONTMATTER_PATTERN = re.compile(
 
 def _parse_attrs_str(attrs_str: Optional[str]) -> Dict[str, Any]:
     """Parse attribute string into a dictionary using ATTR_PATTERN."""
+    if not attrs_str: return {}
+    return dict(_parse_attrs_items(attrs_str))
+
+@lru_cache(maxsize=1024)
+def _parse_attrs_items(attrs_str: str) -> Tuple[Tuple[str, Any], ...]:
+    """Scan an attribute string once; repeated tags reuse the cached pairs."""
     attrs = {}
-    if not attrs_str: return attrs
-    for match in ATTR_PATTERN.finditer(attrs_str):
-        key = match.group('key')
-        val_double, val_single, val_unquoted = match.group("double", "single", "unquoted")
-        value = True # Default for boolean attribute
-        if val_double is not None: value = val_double
-        elif val_single is not None: value = val_single
-        elif val_unquoted is not None: value = val_unquoted
-        elif match.group("value") is not None: value = "" # Value exists but is empty
-        attrs[key] = value
-    return attrs
+    for match in _iter_attrs(attrs_str):
+        value = match.group('value')
+        if value is None: value = True # Boolean attribute
+        elif value[0] in '"\'': value = value[1:-1] # Quoted; the pattern guarantees a matching close
+        attrs[match.group('key')] = value
+    return tuple(attrs.items())
+
+@lru_cache(maxsize=64)
+def _match_open_tag(pattern: re.Pattern, line: str) -> Optional[Tuple[re.Match, str]]:
+    """Match an opening tag and lowercase its name; start() of each token and read() share the result."""
+    match = pattern.match(line)
+    return (match, match.group(1).lower()) if match else None
+
+@lru_cache(maxsize=128)
+def _nested_open_pattern(tag_name: str) -> re.Pattern:
+    """Opening-tag pattern anchored to one tag name, with the same groups as OPEN_TAG_PATTERN."""
+    return re.compile(rf'^\s*<({re.escape(tag_name)})(?:\s++([^>]*?))?\s*+(/?)>', re.IGNORECASE)
 
 # --- Frontmatter Parsing ---
 
+@lru_cache(maxsize=1024)
+def _load_yaml(frontmatter_text: str) -> Any:
+    """Load a frontmatter block; unchanged files reuse the cached result on rebuilds."""
+    return yaml.load(frontmatter_text, Loader=_YamlLoader)
+
 def parse_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """Parses YAML frontmatter from the beginning of the content string.
     
@@ -85,11 +121,12 @@ def parse_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], Optional[
         A tuple of (metadata, content). If there's an error parsing the YAML,
         returns (None, None) to indicate the file should be skipped.
     """
-    if not content.strip().startswith('---'):
+    stripped = content.strip()
+    if not stripped.startswith('---'):
         return {}, content
     match = FRONTMATTER_PATTERN.match(content)
     if not match:
-        if content.strip() == '---': return {}, '' # Handle '---' only
+        if stripped == '---': return {}, '' # Handle '---' only
         logger.debug("No frontmatter block found despite '---' prefix.")
         return {}, content
 
@@ -99,7 +136,7 @@ def parse_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], Optional[
     if not frontmatter_text.strip(): return {}, remaining_content # Empty block
 
     try:
-        metadata = yaml.safe_load(frontmatter_text)
+        metadata = deepcopy(_load_yaml(frontmatter_text)) # Callers mutate metadata
         if metadata is None: metadata = {}
         if not isinstance(metadata, dict):
             logger.warning("Frontmatter is not a dictionary (type: %s). Treating as empty.", type(metadata).__name__)
@@ -117,15 +154,7 @@ def parse_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], Optional[
 class BaseCustomMistletoeBlock(BlockToken):
     """Base class for custom block tokens using Mistletoe's read() pattern."""
     parse_inner: ClassVar[bool]
-    _OPEN_TAG_PATTERN: ClassVar[re.Pattern] = re.compile(
-        r'^\s*<([a-zA-Z][a-zA-Z0-9\-_]*)' # 1: Tag name
-        r'(?:\s+([^>]*?))?'              # 2: Attributes (non-greedy)
-        r'\s*(/?)>'                      # 3: Optional self-closing slash and closing >
-        , re.VERBOSE | re.IGNORECASE
-    )
-    _CLOSE_TAG_PATTERN: ClassVar[re.Pattern] = re.compile(
-        r'^\s*</([a-zA-Z][a-zA-Z0-9\-_]*)>\s*$', re.IGNORECASE
-    )
+    _OPEN_TAG_PATTERN: ClassVar[re.Pattern] = OPEN_TAG_PATTERN
 
     def __init__(self, result: Dict):
         """Initialize token from data returned by read()."""
@@ -136,8 +165,8 @@ class BaseCustomMistletoeBlock(BlockToken):
         self._children = []        
         
         if getattr(self.__class__, 'parse_inner', False) and self.content:            
-            # Split into lines while preserving newlines and pass directly to Mistletoe's tokenizer
-            inner_lines = self.content.splitlines(keepends=True)
+            # Reuse the lines read() collected; otherwise split while preserving newlines
+            inner_lines = result.get('lines') or self.content.splitlines(keepends=True)
             self._children = list(block_tokenizer.tokenize(inner_lines, block_token._token_types))
             
             logger.debug("[%s] Initialized: tag=%s, attrs=%s, children=%d",
@@ -151,10 +180,9 @@ class BaseCustomMistletoeBlock(BlockToken):
     @classmethod
     def start(cls, line: str) -> bool:
         """Check if line matches the opening tag pattern AND specific tag rules."""
-        match = cls._OPEN_TAG_PATTERN.match(line)
-        if not match: return False
-        tag_name = match.group(1).lower()        
-        return cls._is_tag_match(tag_name)
+        if not line.lstrip().startswith('<'): return False # Plain Markdown; skip the regex
+        opened = _match_open_tag(cls._OPEN_TAG_PATTERN, line)
+        return opened is not None and cls._is_tag_match(opened[1])
 
     @classmethod
     def _is_tag_match(cls, tag_name: str) -> bool:
@@ -171,61 +199,52 @@ class BaseCustomMistletoeBlock(BlockToken):
         start_pos = lines.get_pos()
         start_line_num = lines.line_number()
         line = next(lines) # Consume the starting line
-        open_match = cls._OPEN_TAG_PATTERN.match(line)
-        if not open_match: lines.set_pos(start_pos); return None # Should not happen if start() worked
+        opened = _match_open_tag(cls._OPEN_TAG_PATTERN, line)
+        if not opened: lines.set_pos(start_pos); return None # Should not happen if start() worked
 
-        tag_name = open_match.group(1).lower()
-        attrs_str = open_match.group(2)
-        attrs = _parse_attrs_str(attrs_str)
+        open_match, tag_name = opened
+        attrs_str = open_match.group(2) # Parsed only once the block is known to be valid
         
         # early return for self-closing tags
         if cls.is_self_closing(tag_name, open_match):
-            return {"tag_name": tag_name, "attrs": attrs, "content": "", "is_self_closing": True}
+            return {"tag_name": tag_name, "attrs": _parse_attrs_str(attrs_str), "content": "", "is_self_closing": True}
 
         # --- Check for closing tag on the SAME line ---
         rest_of_line = line[open_match.end(0):]  # Everything after the opening tag
-        close_pattern_same_line = re.compile(f'</({tag_name})>\\s*$', re.IGNORECASE)
-        close_match_same_line = close_pattern_same_line.search(rest_of_line)
+        close_tag = f'</{tag_name}>'
+        rest_stripped = rest_of_line.rstrip()
 
-        if close_match_same_line:
-             content_str = rest_of_line[:close_match_same_line.start()]
+        if rest_stripped[-len(close_tag):].lower() == close_tag:
+             content_str = rest_stripped[:-len(close_tag)]
              logger.debug("[%s] Found closing tag on same line for: %s", cls.__name__, tag_name)
-             return {"tag_name": tag_name, "attrs": attrs, "content": content_str, "is_self_closing": False}
+             return {"tag_name": tag_name, "attrs": _parse_attrs_str(attrs_str), "content": content_str, "is_self_closing": False}
 
         # --- Multi-line content ---
         content_lines = [rest_of_line]  # Start with rest of opening line
+        nested_open = _nested_open_pattern(tag_name).match if cls is NestedContentToken else None
         nesting_level = 1
         found_closing_tag = False
-        while True:
-            try:
-                next_line = lines.peek()
-                if next_line is None: break # EOF
-
-                close_match = cls._CLOSE_TAG_PATTERN.match(next_line)
-                if close_match and close_match.group(1).lower() == tag_name:
-                    nesting_level -= 1
-                    if nesting_level == 0:
-                        next(lines)
-                        found_closing_tag = True
-                        break
-
-                consumed_line = next(lines)
-                content_lines.append(consumed_line)
-
-                if cls is NestedContentToken:
-                    nested_open_match = cls._OPEN_TAG_PATTERN.match(consumed_line)
-                    if nested_open_match and nested_open_match.group(1).lower() == tag_name:
-                        # Only increase nesting level if it's not a self-closing tag
-                        if not cls.is_self_closing(tag_name, nested_open_match):
-                            nesting_level += 1
-            except StopIteration: break # EOF
+        for next_line in lines:
+            if '</' in next_line and next_line.strip().lower() == close_tag:
+                nesting_level -= 1
+                if nesting_level == 0:
+                    found_closing_tag = True
+                    break
+
+            content_lines.append(next_line)
+
+            if nested_open and (nested_open_match := nested_open(next_line)):
+                # Only increase nesting level if it's not a self-closing tag
+                if not cls.is_self_closing(tag_name, nested_open_match):
+                    nesting_level += 1
 
         if not found_closing_tag:
             logger.warning("[%s] Unclosed tag '%s' starting on line %d", cls.__name__, tag_name, start_line_num + 1)
             lines.set_pos(start_pos); return None
         
         content_str = "".join(content_lines)
-        return {"tag_name": tag_name, "attrs": attrs, "content": content_str, "is_self_closing": False}
+        return {"tag_name": tag_name, "attrs": _parse_attrs_str(attrs_str), "content": content_str,
+                "lines": content_lines, "is_self_closing": False}
 
 class RawBlockToken(BaseCustomMistletoeBlock):
     """Token for blocks whose content should not be parsed as Markdown."""
@@ -241,7 +260,6 @@ class NestedContentToken(BaseCustomMistletoeBlock):
     def _is_tag_match(cls, tag_name: str) -> bool:
         """Matches any tag not handled by RawBlockToken."""
         # Only match custom tags (not standard HTML tags)
-        is_match = tag_name not in RAW_BLOCK_TAGS and not tag_name in STANDARD_HTML_TAGS
-        return is_match
+        return tag_name not in NON_CUSTOM_TAGS
 
 
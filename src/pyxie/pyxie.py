@@ -283,6 +283,15 @@ class Pyxie:
         slug: Optional[str] = None
     ) -> None:
         """Invalidate cache for specific items or collections."""
+        if collection and slug:
+            targets = [item] if (item := self._items.get(slug)) else []
+        elif collection:
+            targets = self._collections.get(collection, ())
+        else:
+            targets = self._items.values()
+        for item in targets:
+            item.invalidate_html()  # Memoized HTML would otherwise outlive the cache entry
+            
         if not self.cache:
             return
             
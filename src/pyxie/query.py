@@ -58,7 +58,7 @@ COMPARISON_OPERATORS = {
 CONTAINS_OP = "contains"
 IN_OP = "in"
 
-@dataclass
+@dataclass(slots=True)
 class PaginationInfo:
     """Detailed pagination information."""
     current_page: int
@@ -81,7 +81,7 @@ class PaginationInfo:
         start = max(1, end - window + 1)  # Adjust start if near end
         return range(start, end + 1)
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult(Generic[T]):
     """Result of a query operation."""
     items: List[T]
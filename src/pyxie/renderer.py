@@ -39,6 +39,13 @@ from .parser import (
 
 logger = logging.getLogger(__name__)
 
+# Heading ID slug patterns
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+NON_SLUG_CHARS_PATTERN = re.compile(r'[^\w\s-]')
+SLUG_SEPARATOR_PATTERN = re.compile(r'[-\s]+')
+
+CUSTOM_BLOCK_TOKENS = (RawBlockToken, NestedContentToken)
+
 # --- Custom Mistletoe Renderer ---
 
 class PyxieRenderer(HTMLRenderer):
@@ -156,9 +163,9 @@ class PyxieRenderer(HTMLRenderer):
 
     def _make_id(self, text: str) -> str:
         """Generate a unique ID from heading text."""        
-        base_id = re.sub(r'<[^>]+>', '', text) # Strip tags first
-        base_id = re.sub(r'[^\w\s-]', '', base_id.lower()).strip()
-        base_id = re.sub(r'[-\s]+', '-', base_id) or 'section'
+        base_id = HTML_TAG_PATTERN.sub('', text) if '<' in text else text # Strip tags first
+        base_id = NON_SLUG_CHARS_PATTERN.sub('', base_id.lower()).strip()
+        base_id = SLUG_SEPARATOR_PATTERN.sub('-', base_id) or 'section'
         header_id = base_id
         counter = 1
         while header_id in self._used_ids:
@@ -205,30 +212,31 @@ def render_content(
     module_name = "Renderer"
     operation_name = "render_content"
     file_path = getattr(item, 'source_path', None)    
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     try:        
         # 1. Get Layout HTML
-        log(logger, module_name, "debug", operation_name, "Fetching layout...", file_path=file_path)
+        if debug: log(logger, module_name, "debug", operation_name, "Fetching layout...", file_path=file_path)
         layout_result: LayoutResult = handle_cache_and_layout(item)
         if layout_result.error:            
             return format_error_html(layout_result.error, "Layout Loading")
         layout_html = layout_result.html
         if not layout_html:             
             return format_error_html("Layout 'default' not found", "Layout Loading")
-        log(logger, module_name, "debug", operation_name, "Layout HTML obtained.", file_path=file_path)
+        if debug: log(logger, module_name, "debug", operation_name, "Layout HTML obtained.", file_path=file_path)
 
         # 2. Prepare Content & Render Fragment
         rendered_fragment = ""
         if item.content and item.content.strip():
-            log(logger, module_name, "debug", operation_name, "Preparing Mistletoe render...", file_path=file_path)            
-            custom_tokens_for_parsing = [RawBlockToken, NestedContentToken]
-            log(logger, module_name, "debug", operation_name, f"Using custom tokens: {[t.__name__ for t in custom_tokens_for_parsing]}", file_path=file_path)
+            if debug:
+                log(logger, module_name, "debug", operation_name, "Preparing Mistletoe render...", file_path=file_path)
+                log(logger, module_name, "debug", operation_name, f"Using custom tokens: {[t.__name__ for t in CUSTOM_BLOCK_TOKENS]}", file_path=file_path)
 
-            with PyxieRenderer(*custom_tokens_for_parsing) as renderer:
+            with PyxieRenderer(*CUSTOM_BLOCK_TOKENS) as renderer:
                 try:                                        
                     doc = Document(item.content)
                     rendered_fragment = renderer.render(doc)
-                    log(logger, module_name, "debug", operation_name, "Successfully rendered Markdown to fragment.", file_path=file_path)
+                    if debug: log(logger, module_name, "debug", operation_name, "Successfully rendered Markdown to fragment.", file_path=file_path)
                 except Exception as parse_render_err:                    
                     logger.error("Error during Mistletoe parsing/rendering", exc_info=True)
                     rendered_fragment = format_error_html(parse_render_err, "Content Rendering")
@@ -236,7 +244,7 @@ def render_content(
             log(logger, module_name, "info", operation_name, "Markdown content is empty or whitespace only.", file_path=file_path)
 
         # 3. Process Layout via Slots Module
-        log(logger, module_name, "debug", operation_name, "Processing layout and slots...", file_path=file_path)
+        if debug: log(logger, module_name, "debug", operation_name, "Processing layout and slots...", file_path=file_path)
         final_html_fragment = process_layout(
             layout_html=layout_html,
             rendered_html=rendered_fragment,
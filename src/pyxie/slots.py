@@ -17,14 +17,14 @@ Handles layout processing for Pyxie: slot extraction and filling based on data-s
 """
 
 import logging
+import re
 from typing import Dict, Optional, Any, NamedTuple
 
 from lxml import etree, html
 from lxml.html import HtmlElement
 
 from .errors import SlotError
-from .parser import RAW_BLOCK_TAGS
-from .constants import STANDARD_HTML_TAGS
+from .parser import NON_CUSTOM_TAGS
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +32,17 @@ logger = logging.getLogger(__name__)
 SLOT_ATTR: str = "data-slot"
 CONDITION_ATTR: str = "data-pyxie-show"
 CLASS_ATTR: str = "class"
-NON_SLOT_TAGS: frozenset[str] = frozenset(RAW_BLOCK_TAGS | STANDARD_HTML_TAGS)
+NON_SLOT_TAGS: frozenset[str] = NON_CUSTOM_TAGS
+
+# Compiled XPath expressions, evaluated for every rendered page
+TOP_LEVEL_NODES_XPATH = etree.XPath('./* | ./text()[normalize-space()]')
+CHILD_ELEMENTS_XPATH = etree.XPath('./*')
+CONDITIONAL_XPATH = etree.XPath(f'//*[@{CONDITION_ATTR}]')
+CONDITIONAL_SLOTS_XPATH = etree.XPath(f'//*[@{CONDITION_ATTR}]//*[@{SLOT_ATTR}]')
+UNCONDITIONAL_SLOTS_XPATH = etree.XPath(f'//*[@{SLOT_ATTR} and not(ancestor::*[@{CONDITION_ATTR}])]')
+
+# Trailing whitespace plus any blank lines before a newline
+BLANK_LINE_PATTERN = re.compile(r'\s*\n')
 
 class ParsedContent(NamedTuple):
     """Represents parsed HTML content with extracted slots."""
@@ -89,7 +99,7 @@ def extract_slots(rendered_html: str) -> ParsedContent:
     slots: Dict[str, str] = {}
     main_parts = []
 
-    for element in tree.xpath('./* | ./text()[normalize-space()]'):
+    for element in TOP_LEVEL_NODES_XPATH(tree):
         if isinstance(element, HtmlElement):
             slot_name = element.get(SLOT_ATTR)
             if slot_name:
@@ -116,7 +126,7 @@ def fill_slot(placeholder: HtmlElement, slot_html: str) -> None:
     """Fill a slot placeholder with content."""
     # Store original content for default handling
     original_text = placeholder.text
-    original_children = list(placeholder.xpath('./*'))
+    original_children = CHILD_ELEMENTS_XPATH(placeholder)
 
     if not slot_html.strip():
         # If no content provided and no default content, remove the element
@@ -130,7 +140,7 @@ def fill_slot(placeholder: HtmlElement, slot_html: str) -> None:
     # Store original attributes and clear content
     original_attrs = dict(placeholder.attrib)
     placeholder.text = None
-    for child in placeholder.xpath('./*'):
+    for child in CHILD_ELEMENTS_XPATH(placeholder):
         placeholder.remove(child)
 
     if content_element is not None:
@@ -159,17 +169,19 @@ def fill_slot(placeholder: HtmlElement, slot_html: str) -> None:
                 placeholder.set(attr, value)
 
         # Copy content
-        if content_element.text and content_element.text.strip():
-            placeholder.text = content_element.text.strip()
-        for child in content_element.xpath('./*'):
+        text = content_element.text.strip() if content_element.text else ""
+        if text:
+            placeholder.text = text
+        for child in CHILD_ELEMENTS_XPATH(content_element):
             placeholder.append(child)
 
         # Handle tail text
-        if content_element.tail and content_element.tail.strip():
+        tail = content_element.tail.strip() if content_element.tail else ""
+        if tail:
             if placeholder.text:
-                placeholder.text += content_element.tail.strip()
+                placeholder.text += tail
             else:
-                placeholder.text = content_element.tail.strip()
+                placeholder.text = tail
     else:
         # Handle text-only content
         placeholder.text = slot_html.strip()
@@ -200,7 +212,7 @@ def check_condition(condition: str, slots: Dict[str, str], context: Dict[str, An
 
 def process_conditionals(tree: HtmlElement, slots: Dict[str, str], context: Dict[str, Any]) -> None:
     """Process conditional visibility in the layout."""
-    for element in tree.xpath(f'//*[@{CONDITION_ATTR}]'):
+    for element in CONDITIONAL_XPATH(tree):
         condition = element.get(CONDITION_ATTR, "").strip()
         if condition and not check_condition(condition, slots, context):
             preserve_tail_text(element)
@@ -210,14 +222,14 @@ def process_conditionals(tree: HtmlElement, slots: Dict[str, str], context: Dict
 def fill_slots_in_tree(tree: HtmlElement, slots: Dict[str, str]) -> None:
     """Fill all slots in the layout tree."""
     # First fill slots in conditional elements
-    for element in tree.xpath(f'//*[@{CONDITION_ATTR}]//*[@{SLOT_ATTR}]'):
+    for element in CONDITIONAL_SLOTS_XPATH(tree):
         slot_name = element.get(SLOT_ATTR)
         if slot_name and slot_name in slots:
             fill_slot(element, slots[slot_name])
         element.attrib.pop(SLOT_ATTR, None)
 
     # Then fill remaining slots
-    for element in tree.xpath(f'//*[@{SLOT_ATTR} and not(ancestor::*[@{CONDITION_ATTR}])]'):
+    for element in UNCONDITIONAL_SLOTS_XPATH(tree):
         slot_name = element.get(SLOT_ATTR)
         if slot_name:
             if slot_name in slots:
@@ -233,7 +245,7 @@ def format_output(tree: HtmlElement, original_layout: str) -> str:
     
     # Handle HTML/body wrappers if needed
     if (tree.tag.lower() == 'html' and 
-        not original_layout.strip().lower().startswith('<html')):
+        original_layout.lstrip()[:5].lower() != '<html'):
         body = tree.find('.//body')
         if body is not None:
             parts = ([body.text] if body.text and body.text.strip() else [] +
@@ -245,9 +257,8 @@ def format_output(tree: HtmlElement, original_layout: str) -> str:
     if result.startswith('<!DOCTYPE'):
         result = result.split('>', 1)[1].lstrip()
 
-    # Normalize indentation
-    lines = [line.rstrip() for line in result.splitlines() if line.strip()]
-    return '\n'.join(lines)
+    # Drop trailing whitespace and blank lines in one pass
+    return BLANK_LINE_PATTERN.sub('\n', result).lstrip('\n').rstrip()
 
 def process_layout(
     layout_html: str,
@@ -267,10 +278,11 @@ def process_layout(
         
         # 3. Handle default slot
         if default_slot_name not in slots_to_fill and content.main_content:
-            main_tree = parse_html(content.main_content)
+            # Markup-free text has no top-level elements, so skip the parse
+            multiple_roots = '<' in content.main_content and len(parse_html(content.main_content)) > 1
             slots_to_fill[default_slot_name] = (
                 f'<div>{content.main_content}</div>'
-                if len(main_tree) > 1
+                if multiple_roots
                 else content.main_content
             )
         
@@ -19,12 +19,17 @@ from typing import Dict, Any, TypedDict, Union, Optional, List
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
+from fastcore.xml import NotStr
 
 from .constants import DEFAULT_METADATA
 from .errors import log
+from .utilities import normalize_tags
 
 logger = logging.getLogger(__name__)
 
+_TITLE_SEPARATORS = str.maketrans("-_", "  ")
+_SEED_STRIP_CHARS = str.maketrans("", "", "-_")
+
 @dataclass
 class ContentItem:
     """A content item with flexible metadata and content handling.
@@ -59,7 +64,7 @@ class ContentItem:
             # Get the stem from source_path (now guaranteed to be a Path)
             title = self.source_path.stem
             # Replace both hyphens and underscores with spaces
-            title = title.replace("-", " ").replace("_", " ")
+            title = title.translate(_TITLE_SEPARATORS)
             self.metadata["title"] = title.title()
     
     def __getattr__(self, name: str) -> Any:
@@ -95,9 +100,7 @@ class ContentItem:
     @property
     def tags(self) -> List[str]:
         """Get normalized list of tags."""
-        raw_tags = self.metadata.get("tags", [])
-        from .utilities import normalize_tags
-        return normalize_tags(raw_tags)
+        return normalize_tags(self.metadata.get("tags", []))
     
     def _generate_image_seed(self) -> str:
         """Generate a unique seed for image generation.
@@ -107,7 +110,7 @@ class ContentItem:
         ensures consistent image generation for the same post.
         """
         # Remove special characters from slug to make it more URL-friendly
-        clean_slug = self.slug.replace("-", "").replace("_", "")        
+        clean_slug = self.slug.translate(_SEED_STRIP_CHARS)
         return f"{self.index:04d}-{clean_slug}"
     
     @property
@@ -136,6 +139,30 @@ class ContentItem:
                 return None
         return None
     
+    @property
+    def html(self) -> str:
+        """Render the item through its layout; successful renders are memoized."""
+        if (cached := self.__dict__.get('_html_cache')) is not None:
+            return cached
+        from .renderer import render_content  # Imported here to avoid a circular import
+        try:
+            result = render_content(self)
+        except Exception as e:
+            return f"Error: {e}"  # Not memoized, so a transient failure can recover
+        self.__dict__['_html_cache'] = result
+        return result
+    
+    def render(self) -> Optional[NotStr]:
+        """Return the rendered HTML wrapped for direct use in FastHTML components."""
+        try:
+            return NotStr(self.html)
+        except AttributeError:
+            return None
+    
+    def invalidate_html(self) -> None:
+        """Drop the memoized HTML so the next access re-renders."""
+        self.__dict__.pop('_html_cache', None)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -156,16 +183,16 @@ class ContentItem:
 
 PathLike = Union[str, Path]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RenderResult:
     """Result of rendering content."""
     content: str = ""
     error: Optional[str] = None
+    success: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def success(self) -> bool:
-        """Return True if there is no error."""
-        return self.error is None and not 'class="error"' in self.content
+    def __post_init__(self):
+        """Decide success once; the result is immutable."""
+        object.__setattr__(self, "success", self.error is None and 'class="error"' not in self.content)
 
 class Metadata(TypedDict, total=False):
     """Common metadata fields."""
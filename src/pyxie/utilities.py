@@ -18,14 +18,18 @@ This module contains general-purpose utilities used across the package.
 """
 
 import logging
-from typing import Dict, Optional, Any, List, Union
+from typing import Dict, Optional, Any, List, Union, TYPE_CHECKING
 from pathlib import Path
 import hashlib
 import importlib.util
 import os
-from .types import ContentItem
 
 from .errors import log
+from . import parser
+from .constants import DEFAULT_METADATA
+
+if TYPE_CHECKING:
+    from .types import ContentItem
 
 logger = logging.getLogger(__name__)
 
@@ -73,13 +77,11 @@ def load_content_file(
         ContentItem if successful, None if loading fails
     """
     try:
-        from .parser import parse_frontmatter
-        from .types import ContentItem
-        from .constants import DEFAULT_METADATA
+        from .types import ContentItem  # types imports this module
         
         # Load and parse content
         content = file_path.read_text()
-        metadata, content = parse_frontmatter(content)
+        metadata, content = parser.parse_frontmatter(content)
         
         # Skip file if metadata parsing failed
         if metadata is None or content is None:
@@ -151,7 +153,7 @@ def _find_module_in_context(
 
 def _update_namespace_from_module(module: Any, module_name: str, namespace: Dict[str, Any]) -> None:
     """Add module and its attributes to the namespace dictionary."""
-    module_short_name = module_name.split('.')[-1]
+    module_short_name = module_name.rpartition('.')[2]
     namespace[module_short_name] = module
     
     for name in dir(module):
@@ -165,7 +167,7 @@ def safe_import(
     logger_instance: Optional[logging.Logger] = None
 ) -> Optional[Any]:
     """Import a module with fallbacks to custom paths."""
-    if logger_instance:
+    if logger_instance and logger_instance.isEnabledFor(logging.DEBUG):
         log(logger_instance, "Utilities", "debug", "import", f"Attempting to import '{module_name}'")
     
     module = None
@@ -347,6 +347,32 @@ def test_py_to_js_conversion():
     except ValueError as e:
         assert str(e) == "test error"
 
+def test_py_to_js_nested_output():
+    """Test that nested values with functions render as indented JavaScript."""
+    from pyxie.fasthtml import py_to_js
+    
+    data = {"options": {"labels": ["a", "b"], "sizes": [1, 2.5, None, True]}, "format": "__FUNCTION__v => v"}
+    assert py_to_js(data, indent=1) == (
+        '{\n'
+        '    "options": {\n'
+        '      "labels": [\n        "a",\n        "b"\n      ],\n'
+        '      "sizes": [\n        1,\n        2.5,\n        null,\n        true\n      ]\n'
+        '    },\n'
+        '    "format": function(index) { return v => v; }\n'
+        '  }'
+    )
+    assert py_to_js({"empty": [], "obj": {}}) == '{\n  "empty": [],\n  "obj": {}\n}'
+
+def test_py_to_js_failure_degrades_only_enclosing_container():
+    """Test that an element that cannot be converted only falls back for its own container."""
+    from pyxie.fasthtml import py_to_js
+    
+    class CustomObj:
+        def __str__(self): raise ValueError("test error")
+    
+    obj = CustomObj()
+    assert py_to_js({"a": [1, obj], "b": 2}) == f'{{\n  "a": [1, {obj!r}],\n  "b": 2\n}}'
+
 def test_pyxie_xml_advanced():
     """Test advanced PyxieXML functionality."""
     from pyxie.fasthtml import PyxieXML
@@ -389,6 +415,52 @@ def test_fasthtml_executor_context():
     assert results == ['test']
     assert executor.namespace is not None
 
+def test_fasthtml_executor_collects_imports_from_ast():
+    """Top-level imports are read from the parsed code, including aliases and comma lists."""
+    from pyxie.fasthtml import FastHTMLExecutor
+
+    code = (
+        "import json, textwrap  # two modules\n"
+        "import os.path as osp\n"
+        "notes = '''\n"
+        "import not_a_module\n"
+        "'''\n"
+        "show(json.dumps([1]), osp.basename('/a/b'))\n"
+    )
+    with FastHTMLExecutor() as executor:
+        assert executor.execute(code) == ['[1]', 'b']
+        assert 'textwrap' in executor.namespace
+        assert 'not_a_module' not in executor.namespace
+
+def test_process_imports_is_used_by_executor_and_tolerates_syntax_errors(monkeypatch):
+    """The executor resolves imports through process_imports, which never raises on bad code."""
+    import pyxie.fasthtml as fasthtml_module
+    from pyxie.fasthtml import FastHTMLExecutor, process_imports
+
+    namespace = {}
+    process_imports("import json\ndef broken(:", namespace)
+    assert 'json' not in namespace
+
+    calls = []
+    original = fasthtml_module.process_imports
+    monkeypatch.setattr(fasthtml_module, "process_imports",
+                        lambda code, ns, path=None: calls.append(code) or original(code, ns, path))
+    with FastHTMLExecutor() as executor:
+        assert executor.execute("import json\nshow(json.dumps(1))") == ['1']
+    assert calls == ["import json\nshow(json.dumps(1))"]
+
+def test_fasthtml_renderer_does_not_pin_block_classes():
+    """Classes defined inside executed blocks are not kept alive by the renderer cache."""
+    import gc
+    from pyxie.fasthtml import FastHTMLRenderer
+
+    code = "class Card:\n    def __str__(self): return 'card'\nshow(Card())"
+    for _ in range(50):
+        assert execute_fasthtml(code).content == 'card'
+    gc.collect()
+
+    assert not any(t.__name__ == 'Card' for t in FastHTMLRenderer._renderers)
+
 def test_fasthtml_renderer_edge_cases():
     """Test FastHTMLRenderer edge cases."""
     from pyxie.fasthtml import FastHTMLRenderer
@@ -167,6 +167,57 @@ def test_autodiscover_error_handling(test_paths):
     assert "valid_layout" in registry._layouts
 
 
+def test_autodiscover_skips_modules_without_layouts(test_paths):
+    """Test that modules never mentioning layouts are not executed."""
+    marker = test_paths['app_root'] / "executed.txt"
+    (test_paths['app_root'] / "server.py").write_text(
+        f"from pathlib import Path\nPath({str(marker)!r}).write_text('ran')\n"
+    )
+    create_layout_file(test_paths['layouts'] / "valid.py", "valid", "valid_layout")
+
+    Pyxie(
+        content_dir=test_paths['content'],
+        cache_dir=test_paths['cache']
+    )
+
+    assert "valid_layout" in registry._layouts
+    assert not marker.exists()
+
+
+def test_autodiscover_does_not_follow_symlinked_directories(test_paths, tmp_path):
+    """Test that symlinked directories are not descended into during discovery."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    create_layout_file(outside / "external.py", "external", "external_layout")
+    (test_paths['layouts'] / "external").symlink_to(outside, target_is_directory=True)
+    (test_paths['layouts'] / "loop").symlink_to(test_paths['layouts'], target_is_directory=True)
+    create_layout_file(test_paths['layouts'] / "valid.py", "valid", "valid_layout")
+
+    Pyxie(
+        content_dir=test_paths['content'],
+        cache_dir=test_paths['cache']
+    )
+
+    assert "valid_layout" in registry._layouts
+    assert "external_layout" not in registry._layouts
+
+
+def test_resolve_layout_paths_uses_filesystem_name_matching(tmp_path, monkeypatch):
+    """Test that conventional directories are matched by the filesystem, as on case-insensitive systems."""
+    app_root = tmp_path / "app"
+    content_dir = app_root / "content"
+    content_dir.mkdir(parents=True)
+    (app_root / "Layouts").mkdir()
+    
+    # Emulate a case-insensitive filesystem resolving "layouts" to "Layouts"
+    real_is_dir = Path.is_dir
+    monkeypatch.setattr(Path, "is_dir", lambda self: real_is_dir(self) or (
+        self.parent == app_root and real_is_dir(app_root / self.name.capitalize())))
+    
+    paths = registry.resolve_layout_paths(content_dir, None)
+    assert app_root / "layouts" in paths
+
+
 def test_autodiscover_nonexistent_directory(test_paths):
     """Test auto-discovery with nonexistent directory."""
     # Create a valid layout file
@@ -109,6 +109,41 @@ def test_no_frontmatter() -> None:
     assert metadata == {}  # No frontmatter returns empty dict
     assert content == remaining_content
 
+def test_frontmatter_delimiters_allow_unicode_whitespace() -> None:
+    """Test that delimiter lines accept the same Unicode whitespace as str.strip()."""
+    content = "\u00a0---\u00a0\ntitle: Spaced\n---\u2028\n# Body"
+
+    metadata, remaining_content = parse_frontmatter(content)
+    assert metadata == {'title': 'Spaced'}
+    assert remaining_content == '# Body'
+
+def test_repeated_frontmatter_is_independent(sample_markdown: str) -> None:
+    """Test that mutating parsed metadata does not leak into later parses."""
+    first, _ = parse_frontmatter(sample_markdown)
+    first['title'] = 'Changed'
+    first['tags'].append('extra')
+
+    second, _ = parse_frontmatter(sample_markdown)
+    assert second['title'] == 'Test Document'
+    assert second['tags'] == ['test', 'sample']
+
+def test_subclass_open_tag_pattern_is_used() -> None:
+    """Test that start() and read() honour a subclass's _OPEN_TAG_PATTERN."""
+    import re
+    from mistletoe.block_tokenizer import FileWrapper
+
+    class MarkedRawToken(RawBlockToken):
+        _OPEN_TAG_PATTERN = re.compile(r'^\s*<(\w+)\s+(data-raw[^>]*?)\s*(/?)>')
+
+    assert RawBlockToken.start("<script>\n")
+    assert not MarkedRawToken.start("<script>\n")
+    assert MarkedRawToken.start("<script data-raw>\n")
+
+    result = MarkedRawToken.read(FileWrapper(["<script data-raw>\n", "x = 1\n", "</script>\n"]))
+    assert result["tag_name"] == "script"
+    assert result["attrs"] == {"data-raw": True}
+    assert result["content"] == "\nx = 1\n"
+
 def test_custom_block_parsing() -> None:
     """Test parsing of custom blocks."""
     content = """<custom class="test">
@@ -279,4 +279,14 @@ show(TestComponent())
     print(f"Average time: {avg_time:.4f} seconds per render")
     
     # Assert reasonable performance
-    assert avg_time < 0.01, f"Rendering took too long: {avg_time:.4f} seconds per render" 
\ No newline at end of file
+    assert avg_time < 0.01, f"Rendering took too long: {avg_time:.4f} seconds per render" 
+
+def test_unterminated_tag_line_performance():
+    """Test that a long unterminated tag line is rejected without heavy backtracking."""
+    line = "<card" + " " * 2000 + "x\n"
+    
+    start_time = time.time()
+    assert not NestedContentToken.start(line)
+    duration = time.time() - start_time
+    
+    assert duration < 0.5, f"Open-tag matching took too long: {duration:.4f} seconds"
@@ -213,6 +213,16 @@ def test_invalidate_cache(sample_content, temp_cache_dir):
     # Invalidate all
     pyxie.invalidate_cache()
 
+def test_invalidate_cache_drops_rendered_html(sample_content):
+    """Test that cache invalidation also drops HTML memoized on items."""
+    pyxie = Pyxie(content_dir=sample_content)
+    item = pyxie.get_item("test")[0]
+
+    for kwargs in ({"collection": "content", "slug": "test"}, {"collection": "content"}, {}):
+        item.__dict__['_html_cache'] = "stale"
+        pyxie.invalidate_cache(**kwargs)
+        assert item.html != "stale"
+
 def test_collection_management(pyxie_instance, tmp_path):
     """Test collection management functionality."""
     # Test adding a new collection
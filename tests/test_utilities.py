@@ -103,7 +103,8 @@ class TestDataUtilities:
         # Test with explicit layout and different metadata layout
         logger_mock = MagicMock()
         assert resolve_default_layout("explicit", {"layout": "custom"}, "test", logger_mock) == "explicit"
-        logger_mock.warning.assert_called_once()
+        logger_mock.log.assert_called_once()
+        assert logger_mock.log.call_args.args[0] == logging.WARNING
 
 class TestModuleImportUtilities:
     """Tests for module import utilities."""
@@ -120,6 +121,27 @@ class TestModuleImportUtilities:
         safe_import("os", namespace)
         assert "os" in namespace
     
+    def test_safe_import_reflects_reloaded_module(self, tmp_path, monkeypatch):
+        """Test that a reloaded module's new values reach the namespace."""
+        import importlib
+        import sys
+        module_file = tmp_path / "pyxie_reload_probe.py"
+        module_file.write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        try:
+            namespace = {}
+            module = safe_import("pyxie_reload_probe", namespace)
+            assert namespace["VALUE"] == 1
+
+            module_file.write_text("VALUE = 2\n")
+            importlib.invalidate_caches()
+            os.utime(module_file, (0, 0))  # Force the reload past the bytecode cache
+            importlib.reload(module)
+            safe_import("pyxie_reload_probe", namespace)
+            assert namespace["VALUE"] == 2
+        finally:
+            sys.modules.pop("pyxie_reload_probe", None)
+
     def test_safe_import_nonexistent_module(self):
         """Test importing a nonexistent module."""
         logger_mock = MagicMock()
@@ -127,7 +149,7 @@ class TestModuleImportUtilities:
         # Test without context path
         module = safe_import("nonexistent_module", logger_instance=logger_mock)
         assert module is None
-        logger_mock.warning.assert_called()
+        assert any(c.args[0] == logging.WARNING for c in logger_mock.log.call_args_list)
         
         # Test with context path
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -161,7 +183,7 @@ class TestModuleImportUtilities:
         logger_mock = MagicMock()
         module = safe_import("error_module", context_path=tmp_path, logger_instance=logger_mock)
         assert module is None
-        logger_mock.error.assert_called()
+        assert any(c.args[0] == logging.ERROR for c in logger_mock.log.call_args_list)
 
 class TestContentLoading:
     """Tests for content loading utilities."""